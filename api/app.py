@@ -86,7 +86,9 @@ def _transport_security_settings() -> TransportSecuritySettings:
 mcp = FastMCP(
     name="wellsky-outreach-mcp",
     instructions=(
-        "WellSky patient outreach workflow interface. Use the reach_out_to_patients tool to register outreach jobs and retrieve a summary report."
+        "WellSky patient outreach workflow interface. Use get_active_patient_census to list active patients, "
+        "reach_out_to_patients to register outreach jobs and retrieve a summary report (detail: full, exceptions, or counts), "
+        "and get_outreach_job to page through a recent exceptions/counts job's full outcomes when the server runs as a single long-lived process."
     ),
     stateless_http=True,
     json_response=True,
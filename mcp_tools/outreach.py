@@ -1,11 +1,35 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Literal, Optional
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import ValidationError
 
-from wellsky_mcp import ContactInfo, Patient, ReachOutInput, process_wellsky_outreach
+from wellsky_mcp import (
+    ContactInfo,
+    OutreachOutcome,
+    OutreachResponse,
+    Patient,
+    ReachOutInput,
+    process_wellsky_outreach,
+)
+
+# Recent jobs are kept in this process's memory only, so get_outreach_job works
+# solely when follow-up calls reach the same long-lived server process. On
+# stateless/serverless deployments (e.g. Vercel) the next call may land on another
+# instance and the job will be reported as unknown. Entries hold patient contact
+# details, so only compact-report jobs are stored, they expire after a TTL, and the
+# oldest jobs are evicted once the store exceeds its job or outcome budget (the
+# newest job is always kept, however large).
+OutreachDetail = Literal["full", "exceptions", "counts"]
+
+MAX_STORED_JOBS = 32
+MAX_STORED_OUTCOMES = 50_000
+JOB_TTL_SECONDS = 15 * 60
+DEFAULT_JOB_PAGE_SIZE = 500
+_JOB_STORE: OrderedDict[str, tuple[float, OutreachResponse]] = OrderedDict()
 
 
 def _mock_directory_lookup(patient_id: str) -> tuple[str, ContactInfo]:
@@ -45,20 +69,67 @@ def _auto_resolve_patients(patient_ids: list[str]) -> list[Patient]:
     return resolved
 
 
+def _evict_expired_jobs(now: float) -> None:
+    while _JOB_STORE:
+        job_id, (stored_at, _) = next(iter(_JOB_STORE.items()))
+        if now - stored_at < JOB_TTL_SECONDS:
+            break
+        del _JOB_STORE[job_id]
+
+
+def _remember_job(job: OutreachResponse) -> None:
+    now = time.monotonic()
+    _evict_expired_jobs(now)
+    _JOB_STORE[job.metadata.jobId] = (now, job)
+
+    stored_outcomes = sum(len(entry.outcomes) for _, entry in _JOB_STORE.values())
+    while len(_JOB_STORE) > 1 and (
+        len(_JOB_STORE) > MAX_STORED_JOBS or stored_outcomes > MAX_STORED_OUTCOMES
+    ):
+        _, (_, evicted) = _JOB_STORE.popitem(last=False)
+        stored_outcomes -= len(evicted.outcomes)
+
+
+def _lookup_job(job_id: str) -> Optional[OutreachResponse]:
+    _evict_expired_jobs(time.monotonic())
+    entry = _JOB_STORE.get(job_id)
+    return entry[1] if entry else None
+
+
+def _count_outcomes(outcomes: list[OutreachOutcome]) -> dict[str, dict[str, int]]:
+    return {
+        "byStatus": dict(Counter(outcome.status for outcome in outcomes)),
+        "byChannel": dict(Counter(outcome.channel for outcome in outcomes)),
+    }
+
+
+def _outcome_line(outcome: OutreachOutcome) -> str:
+    return f"- {outcome.fullName} ({outcome.patientId}) -> " + (
+        f"Queued via {outcome.channel.upper()}"
+        if outcome.status == "queued"
+        else f"Manual review required: {outcome.reason or 'unspecified'}"
+    )
+
+
 def register(server: FastMCP) -> None:
-    """Register the WellSky outreach tool with the provided MCP server."""
+    """Register the WellSky outreach tools with the provided MCP server."""
 
     @server.tool(
         name="reach_out_to_patients",
         description=(
             "Sends outreach notifications for a list of patient IDs using an internal directory "
             "to auto-resolve names and contact information. Only patientIds and an optional "
-            "message are required. Returns a summary."
+            "message are required. Returns a summary. Use detail='exceptions' to list only "
+            "patients needing manual review, or detail='counts' for aggregate counts only. "
+            "detail only takes effect when the outreach is first sent; calling this tool again "
+            "notifies every patient again. On a single long-lived server, full outcomes of "
+            "exceptions/counts jobs can be fetched later, in pages, with get_outreach_job."
         ),
     )
     def reach_out_to_patients(
         patientIds: list[str],
         message: Optional[str] = None,
+        detail: OutreachDetail = "full",
     ) -> dict[str, Any]:
         try:
             # Auto-resolve patients from IDs (pretend the MCP/server has access)
@@ -74,32 +145,95 @@ def register(server: FastMCP) -> None:
 
         job = process_wellsky_outreach(payload)
 
-        queued = sum(1 for outcome in job.outcomes if outcome.status == "queued")
+        counts = _count_outcomes(job.outcomes)
+        queued = counts["byStatus"].get("queued", 0)
         manual = len(job.outcomes) - queued
 
-        summary_lines = [
-            f"- {outcome.fullName} ({outcome.patientId}) -> "
-            + (
-                f"Queued via {outcome.channel.upper()}"
-                if outcome.status == "queued"
-                else f"Manual review required: {outcome.reason or 'unspecified'}"
+        header = [
+            f"Hand-off to WellSky Outreach on {job.metadata.startedAt} (job {job.metadata.jobId}).",
+            f"Queued: {queued} | Needs manual review: {manual}.",
+        ]
+
+        if detail == "full":
+            text_summary = "\n".join(
+                [*header, "", *(_outcome_line(outcome) for outcome in job.outcomes)]
             )
-            for outcome in job.outcomes
+            return {
+                "content": [
+                    {"type": "text", "text": text_summary},
+                    {"type": "json", "json": job.dict(exclude={"dispatchPlan"})},
+                ]
+            }
+
+        _remember_job(job)
+
+        report: dict[str, Any] = {"metadata": job.metadata.dict(), "counts": counts}
+        by_channel = ", ".join(
+            f"{channel}: {count}" for channel, count in sorted(counts["byChannel"].items())
+        )
+        lines = [
+            *header,
+            f"By channel: {by_channel}.",
+            f"Full outcomes may be fetched in pages with get_outreach_job for {JOB_TTL_SECONDS // 60} "
+            "minutes, only if this server runs as a single long-lived process.",
         ]
 
-        text_summary = "\n".join(
-            [
-                f"Hand-off to WellSky Outreach on {job.metadata.startedAt}.",
-                f"Queued: {queued} | Needs manual review: {manual}.",
-                "",
-                *summary_lines,
+        if detail == "exceptions":
+            manual_review = [
+                outcome for outcome in job.outcomes if outcome.status == "needs_manual_review"
             ]
-        )
+            report["manualReview"] = [outcome.dict() for outcome in manual_review]
+            if manual_review:
+                lines.extend(["", *(_outcome_line(outcome) for outcome in manual_review)])
+
+        return {
+            "content": [
+                {"type": "text", "text": "\n".join(lines)},
+                {"type": "json", "json": report},
+            ]
+        }
+
+    @server.tool(
+        name="get_outreach_job",
+        description=(
+            "Retrieves one page of outcomes for a recent reach_out_to_patients job that used "
+            "detail='exceptions' or detail='counts', by its job ID. Page with offset/limit; set "
+            "includeDispatchPlan to also return the per-channel dispatch plan. Jobs are held in "
+            "server memory for a limited time and are only available when the server runs as a "
+            "single long-lived process; stateless/serverless deployments may not find them."
+        ),
+    )
+    def get_outreach_job(
+        jobId: str,
+        offset: int = 0,
+        limit: int = DEFAULT_JOB_PAGE_SIZE,
+        includeDispatchPlan: bool = False,
+    ) -> dict[str, Any]:
+        if offset < 0 or limit < 1:
+            raise ValueError("Invalid page. offset must be >= 0 and limit must be >= 1.")
+
+        job = _lookup_job(jobId)
+        if job is None:
+            raise ValueError(
+                f"Unknown or expired outreach job: {jobId}. Full outcomes are unavailable for "
+                "this job; outreach was already sent and must not be resent to recover them."
+            )
+
+        total = len(job.outcomes)
+        end = offset + limit
+        page: dict[str, Any] = {
+            "metadata": job.metadata.dict(),
+            "total": total,
+            "offset": offset,
+            "nextOffset": end if end < total else None,
+            "outcomes": [outcome.dict() for outcome in job.outcomes[offset:end]],
+        }
+        if includeDispatchPlan:
+            page["dispatchPlan"] = [batch.dict() for batch in job.dispatchPlan]
 
         return {
             "content": [
-                {"type": "text", "text": text_summary},
-                {"type": "json", "json": job.dict()},
+                {"type": "json", "json": page},
             ]
         }
 
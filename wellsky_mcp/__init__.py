@@ -2,6 +2,7 @@
 
 from .models import (
     ContactInfo,
+    DispatchBatch,
     OutreachMetadata,
     OutreachOutcome,
     OutreachResponse,
@@ -13,6 +14,7 @@ from .simulator import process_wellsky_outreach
 
 __all__ = [
     "ContactInfo",
+    "DispatchBatch",
     "OutreachMetadata",
     "OutreachOutcome",
     "OutreachResponse",
@@ -61,7 +61,21 @@ class OutreachOutcome(BaseModel):
     timestamp: str
 
 
+class DispatchBatch(BaseModel):
+    """Homogeneous hand-off batch for a single gateway channel.
+
+    The list fields are parallel: index ``i`` of each list describes the same patient.
+    """
+
+    channel: OutreachChannel
+    patientIds: list[str] = Field(default_factory=list)
+    engagementIds: list[str] = Field(default_factory=list)
+    destinations: list[str] = Field(default_factory=list)
+    messages: list[str] = Field(default_factory=list)
+
+
 class OutreachMetadata(BaseModel):
+    jobId: str
     integration: str
     durationMs: int
     startedAt: str
@@ -69,4 +83,5 @@ class OutreachMetadata(BaseModel):
 
 class OutreachResponse(BaseModel):
     outcomes: list[OutreachOutcome]
+    dispatchPlan: list[DispatchBatch] = Field(default_factory=list)
     metadata: OutreachMetadata
@@ -6,6 +6,7 @@ from uuid import uuid4
 
 from .models import (
     ContactInfo,
+    DispatchBatch,
     OutreachMetadata,
     OutreachOutcome,
     OutreachResponse,
@@ -21,81 +22,123 @@ DEFAULT_TEMPLATE = (
 )
 
 
-def _resolve_channel(
-    patient: Patient,
-    fallback_channel: Optional[OutreachChannel],
-) -> tuple[OutreachStatus, str, str, Optional[str]]:
-    contacts: ContactInfo = patient.contacts
-    available = [(key, value) for key, value in contacts.dict().items() if value]
+# Contact availability is encoded as a bitmask so channel resolution for a whole
+# batch is a handful of integer tests instead of per-patient dict/list building.
+_CHANNEL_ORDER: tuple[OutreachChannel, ...] = ("phone", "sms", "email")
+_CHANNEL_BITS: dict[OutreachChannel, int] = {channel: 1 << index for index, channel in enumerate(_CHANNEL_ORDER)}
 
-    preferred = next(
-        ((channel, value) for channel, value in available if channel == patient.preferredChannel),
-        None,
-    )
+# First available channel (in phone -> sms -> email order) for every possible mask.
+_FIRST_AVAILABLE: tuple[Optional[OutreachChannel], ...] = tuple(
+    next((channel for channel in _CHANNEL_ORDER if mask & _CHANNEL_BITS[channel]), None)
+    for mask in range(1 << len(_CHANNEL_ORDER))
+)
+
+
+def _contact_mask(contacts: ContactInfo) -> int:
+    mask = 0
+    if contacts.phone:
+        mask |= _CHANNEL_BITS["phone"]
+    if contacts.sms:
+        mask |= _CHANNEL_BITS["sms"]
+    if contacts.email:
+        mask |= _CHANNEL_BITS["email"]
+    return mask
 
-    fallback = (
-        next(((channel, value) for channel, value in available if channel == fallback_channel), None)
-        if fallback_channel
-        else None
-    )
 
-    chosen = preferred or fallback or (available[0] if available else None)
+def _pick_channel(
+    mask: int,
+    preferred_channel: Optional[OutreachChannel],
+    fallback_channel: Optional[OutreachChannel],
+) -> Optional[OutreachChannel]:
+    if preferred_channel and mask & _CHANNEL_BITS[preferred_channel]:
+        return preferred_channel
+    if fallback_channel and mask & _CHANNEL_BITS[fallback_channel]:
+        return fallback_channel
+    return _FIRST_AVAILABLE[mask]
+
 
-    if not chosen:
+def _resolve_channel(
+    patient: Patient,
+    fallback_channel: Optional[OutreachChannel],
+) -> tuple[OutreachStatus, Optional[OutreachChannel], str, Optional[str], Optional[str]]:
+    mask = _contact_mask(patient.contacts)
+    channel = _pick_channel(mask, patient.preferredChannel, fallback_channel)
+
+    if channel is None:
         return (
             "needs_manual_review",
-            "unavailable",
+            None,
             (
                 "No viable contact channel detected. Escalated for manual follow-up."
             ),
             (
                 "Patient record is missing reachable contact methods across phone, sms, and email."
             ),
+            None,
         )
 
-    channel, destination = chosen
+    destination: str = getattr(patient.contacts, channel)
     return (
         "queued",
         channel,
         f"Hand-off to WellSky Outreach via {channel.upper()} ({destination}).",
         None,
+        destination,
     )
 
 
-def _build_outcomes(
+def _plan_outreach(
     patients: Iterable[Patient],
     message_template: Optional[str],
     fallback_channel: Optional[OutreachChannel],
     started_at: datetime,
-) -> list[OutreachOutcome]:
+) -> tuple[list[OutreachOutcome], list[DispatchBatch]]:
+    """Resolve channels for the whole batch and group queued hand-offs per channel."""
     outcomes: list[OutreachOutcome] = []
+    batches: dict[OutreachChannel, DispatchBatch] = {}
     template = message_template or DEFAULT_TEMPLATE
+    timestamp = started_at.replace(microsecond=0).isoformat()
 
-    for index, patient in enumerate(patients):
-        message_preview = template.replace("{fullName}", patient.fullName)
-        status, channel, summary, reason = _resolve_channel(patient, fallback_channel)
+    for patient in patients:
+        status, channel, summary, reason, destination = _resolve_channel(patient, fallback_channel)
+        engagement_id = str(uuid4())
+        message_preview = (
+            template.replace("{fullName}", patient.fullName) if status == "queued" else None
+        )
 
         outcomes.append(
             OutreachOutcome(
                 patientId=patient.id,
                 fullName=patient.fullName,
-                engagementId=str(uuid4()),
+                engagementId=engagement_id,
                 status=status,
-                channel=channel,
+                channel=channel or "unavailable",
                 summary=summary,
-                messagePreview=message_preview if status == "queued" else None,
+                messagePreview=message_preview,
                 reason=reason,
-                timestamp=(started_at.replace(microsecond=0).isoformat()),
+                timestamp=timestamp,
             )
         )
 
-    return outcomes
+        if channel is None or destination is None or message_preview is None:
+            continue
+
+        batch = batches.get(channel)
+        if batch is None:
+            batch = batches[channel] = DispatchBatch(channel=channel)
+        batch.patientIds.append(patient.id)
+        batch.engagementIds.append(engagement_id)
+        batch.destinations.append(destination)
+        batch.messages.append(message_preview)
+
+    dispatch_plan = [batches[channel] for channel in _CHANNEL_ORDER if channel in batches]
+    return outcomes, dispatch_plan
 
 
 def process_wellsky_outreach(payload: ReachOutInput) -> OutreachResponse:
     """Process a WellSky outreach job."""
     started_at = datetime.now(tz=timezone.utc)
-    outcomes = _build_outcomes(
+    outcomes, dispatch_plan = _plan_outreach(
         payload.patients,
         payload.messageTemplate,
         payload.fallbackChannel,
@@ -105,9 +148,10 @@ def process_wellsky_outreach(payload: ReachOutInput) -> OutreachResponse:
     duration_ms = int((datetime.now(tz=timezone.utc) - started_at).total_seconds() * 1000)
 
     metadata = OutreachMetadata(
+        jobId=str(uuid4()),
         integration="WellSky Patient Outreach",
         durationMs=duration_ms,
         startedAt=started_at.replace(microsecond=0).isoformat(),
     )
 
-    return OutreachResponse(outcomes=outcomes, metadata=metadata)
+    return OutreachResponse(outcomes=outcomes, dispatchPlan=dispatch_plan, metadata=metadata)